@@ -4,24 +4,44 @@ from enum import IntEnum
 from typing import Annotated, Self
 
 from EventKit import EKReminder  # type: ignore[import-untyped]
+from Foundation import NSDate  # type: ignore[import-untyped]
 from pydantic import BaseModel, BeforeValidator, Field
 
 
 def convert_datetime(v):
     """Convert various datetime formats to Python datetime."""
-    if hasattr(v, "timeIntervalSince1970"):
-        return datetime.fromtimestamp(v.timeIntervalSince1970())
+    # Cheapest checks first; probing attributes on arbitrary objects goes through the ObjC bridge
+    if type(v) is datetime:
+        return v
 
     if isinstance(v, str):
         return datetime.fromisoformat(v)
 
-    if isinstance(v, datetime):
-        return v
+    if isinstance(v, NSDate):
+        return datetime.fromtimestamp(v.timeIntervalSince1970())
 
-    # If we don't recognize the type, let Pydantic handle it
+    # If we don't recognize the type (including datetime subclasses), let Pydantic handle it
     return v
 
 
+# NSDateComponents uses NSIntegerMax for fields that are not set
+NS_UNDEFINED_COMPONENT = 0x7FFFFFFFFFFFFFFF
+
+
+def components_to_datetime(components) -> datetime:
+    """Convert NSDateComponents to a Python datetime, defaulting any unset fields."""
+    # Each selector call crosses the PyObjC bridge, so read every field exactly once
+    y, mo, d = components.year(), components.month(), components.day()
+    h, mi = components.hour(), components.minute()
+    return datetime(
+        year=1 if y == NS_UNDEFINED_COMPONENT else y,
+        month=1 if mo == NS_UNDEFINED_COMPONENT else mo,
+        day=1 if d == NS_UNDEFINED_COMPONENT else d,
+        hour=0 if h == NS_UNDEFINED_COMPONENT else h,
+        minute=0 if mi == NS_UNDEFINED_COMPONENT else mi,
+    )
+
+
 FlexibleDateTime = Annotated[datetime, BeforeValidator(convert_datetime)]
 
 
@@ -33,7 +53,7 @@ class Priority(IntEnum):
     LOW = 9
 
 
-@dataclass
+@dataclass(slots=True)
 class Reminder:
     """Represents a reminder from Apple Reminders."""
     title: str
@@ -48,31 +68,32 @@ class Reminder:
     _raw_reminder: EKReminder | None = None  # Store the original EKReminder object
 
     @classmethod
-    def from_ekreminder(cls, ekreminder: EKReminder) -> "Reminder":
-        """Create a Reminder instance from an EKReminder."""
+    def from_ekreminder(cls, ekreminder: EKReminder, due_date: datetime | None = None) -> "Reminder":
+        """Create a Reminder instance from an EKReminder.
+
+        Args:
+            ekreminder: The EventKit reminder to convert
+            due_date: The reminder's due date if the caller has already computed it
+        """
         # Convert dueDateComponents to datetime if available
-        due_date = None
-        if ekreminder.dueDateComponents():
-            components = ekreminder.dueDateComponents()
-            # Reconstruct datetime from components
-            due_date = datetime(
-                year=components.year() if components.year() != 0x7FFFFFFFFFFFFFFF else 1,
-                month=components.month() if components.month() != 0x7FFFFFFFFFFFFFFF else 1,
-                day=components.day() if components.day() != 0x7FFFFFFFFFFFFFFF else 1,
-                hour=components.hour() if components.hour() != 0x7FFFFFFFFFFFFFFF else 0,
-                minute=components.minute() if components.minute() != 0x7FFFFFFFFFFFFFFF else 0,
-            )
+        components = ekreminder.dueDateComponents() if due_date is None else None
+        if components:
+            due_date = components_to_datetime(components)
+
+        calendar = ekreminder.calendar()
+        priority = ekreminder.priority()
+        url = ekreminder.URL()
 
         return cls(
             title=ekreminder.title() or "",
             identifier=ekreminder.calendarItemIdentifier(),
-            list_name=ekreminder.calendar().title() if ekreminder.calendar() else None,
+            list_name=calendar.title() if calendar else None,
             due_date=due_date,
             notes=ekreminder.notes(),
-            priority=ekreminder.priority() if ekreminder.priority() else 0,
+            priority=priority if priority else 0,
             completed=ekreminder.isCompleted(),
             completion_date=ekreminder.completionDate(),
-            url=str(ekreminder.URL()) if ekreminder.URL() else None,
+            url=str(url) if url else None,
             _raw_reminder=ekreminder,
         )
 
@@ -93,6 +114,9 @@ class Reminder:
         )
 
 
+# The request models double as the MCP tool input schema, so FastMCP validates them
+# exactly once per tool call. Build any internal instances with `model_construct`
+# to avoid running the validators a second time.
 class CreateReminderRequest(BaseModel):
     """Request model for creating a new reminder."""
     title: str
@@ -1,6 +1,7 @@
 import sys
-from datetime import datetime
-from threading import Semaphore
+from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Event
 from typing import Any
 
 from EventKit import (
@@ -8,15 +9,17 @@ from EventKit import (
     EKCalendar,  # type: ignore
     EKEntityTypeReminder,  # type: ignore
     EKEventStore,  # type: ignore
+    EKEventStoreChangedNotification,  # type: ignore
     EKReminder,  # type: ignore
 )
-from Foundation import NSCalendar, NSCalendarUnitDay, NSCalendarUnitHour, NSCalendarUnitMinute, NSCalendarUnitMonth, NSCalendarUnitYear, NSDate, NSDateComponents  # type: ignore
+from Foundation import NSCalendar, NSCalendarUnitDay, NSCalendarUnitHour, NSCalendarUnitMinute, NSCalendarUnitMonth, NSCalendarUnitYear, NSDate, NSDateComponents, NSNotificationCenter  # type: ignore
 from loguru import logger
 
 from .models import (
     CreateReminderRequest,
     Reminder,
     UpdateReminderRequest,
+    components_to_datetime,
 )
 
 logger.remove()
@@ -27,13 +30,35 @@ logger.add(
 )
 
 
+# Margin added to each due-date bound pushed down to EventKit; see list_reminders
+_DUE_DATE_SLACK = timedelta(days=2)
+
+
+# EKReminder declares dueDateComponents as a copy property, so cached instances are never
+# mutated by EventKit and can be shared between reminders with the same due date.
+@lru_cache(maxsize=256)
+def _make_components(year: int, month: int, day: int, hour: int, minute: int) -> NSDateComponents:
+    """Build NSDateComponents for the given date and time fields."""
+    components = NSDateComponents.alloc().init()
+    components.setYear_(year)
+    components.setMonth_(month)
+    components.setDay_(day)
+    components.setHour_(hour)
+    components.setMinute_(minute)
+    return components
+
+
 class RemindersManager:
     def __init__(self):
         self.event_store = EKEventStore.alloc().init()
 
+        # Reminder lists rarely change, so cache them instead of crossing the ObjC bridge on every lookup.
+        # The cache is a single (calendars, titles, calendars_by_title) tuple so it is swapped atomically.
+        self._calendar_cache: tuple[list[Any], list[str], dict[str, Any]] | None = None
+
         # Force a fresh permission check for reminders
         auth_status = EKEventStore.authorizationStatusForEntityType_(EKEntityTypeReminder)
-        logger.debug(f"Initial Reminders authorization status: {auth_status}")
+        logger.debug("Initial Reminders authorization status: {}", auth_status)
 
         # Always request access regardless of current status
         if not self._request_access():
@@ -43,6 +68,15 @@ class RemindersManager:
             )
         logger.info("Reminders access granted successfully")
 
+        # Drop cached reminder lists whenever the store reports an external change
+        notification_center = NSNotificationCenter.defaultCenter()
+        self._store_changed_observer = notification_center.addObserverForName_object_queue_usingBlock_(
+            EKEventStoreChangedNotification,
+            self.event_store,
+            None,
+            lambda notification: self._invalidate_calendar_cache(),
+        )
+
     def list_reminders(
         self,
         start_date: datetime | None = None,
@@ -69,47 +103,72 @@ class RemindersManager:
         reminder_lists = [reminder_list] if reminder_list else None
 
         logger.info(
-            f"Listing reminders in: {list_name if list_name else 'all lists'}, "
-            f"include_completed: {include_completed}"
+            "Listing reminders in: {}, include_completed: {}",
+            list_name if list_name else "all lists",
+            include_completed,
         )
 
-        # Use predicate to fetch reminders
-        predicate = self.event_store.predicateForRemindersInCalendars_(reminder_lists)
+        # Push as much filtering as possible down to the EventKit store. The completed-reminder
+        # predicate filters on completion date rather than due date, so it can't serve the date range.
+        if not include_completed:
+            # Either EventKit bound may be exclusive, and the store compares absolute instants while
+            # the Python filter below compares wall-clock components, so reminders with their own
+            # time zone can sit up to 26 hours away. Widen both bounds by the slack and let the
+            # Python filter trim the exact range.
+            predicate = self.event_store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+                self._widened_nsdate(start_date, -_DUE_DATE_SLACK) if start_date else None,
+                self._widened_nsdate(end_date, _DUE_DATE_SLACK) if end_date else None,
+                reminder_lists,
+            )
+        else:
+            predicate = self.event_store.predicateForRemindersInCalendars_(reminder_lists)
 
         # Fetch reminders using completion handler
-        semaphore = Semaphore(0)
+        done = Event()
         fetched_reminders = []
 
         def completion_handler(reminders):
             nonlocal fetched_reminders
+            # Iterate the NSArray directly later instead of copying it into a Python list
             if reminders:
-                fetched_reminders = list(reminders)
-            semaphore.release()
+                fetched_reminders = reminders
+            done.set()
 
         self.event_store.fetchRemindersMatchingPredicate_completion_(predicate, completion_handler)
-        semaphore.acquire()
-
-        # Filter results based on criteria
+        done.wait()
+
+        # Pick a specialised loop once instead of re-testing loop-invariant filters per reminder.
+        # Only the cheap isCompleted/dueDateComponents selectors are used for filtering;
+        # full Reminder objects are built for the survivors alone.
+        if not (start_date or end_date):
+            if include_completed:
+                return [Reminder.from_ekreminder(ekreminder) for ekreminder in fetched_reminders]
+            return [
+                Reminder.from_ekreminder(ekreminder)
+                for ekreminder in fetched_reminders
+                if not ekreminder.isCompleted()
+            ]
+
+        # Filter by date range; this also guards the range pushed down to EventKit
         results = []
         for ekreminder in fetched_reminders:
             # Filter by completion status
             if not include_completed and ekreminder.isCompleted():
                 continue
 
-            # Filter by date range if specified
-            if start_date or end_date:
-                due_components = ekreminder.dueDateComponents()
-                if not due_components:
-                    continue  # Skip reminders without due dates when filtering by date
+            due_components = ekreminder.dueDateComponents()
+            if not due_components:
+                continue  # Skip reminders without due dates when filtering by date
 
-                # Convert due date components to datetime for comparison
-                due_date = self._components_to_datetime(due_components)
-                if start_date and due_date < start_date:
-                    continue
-                if end_date and due_date > end_date:
-                    continue
+            # Convert due date components to datetime for comparison
+            due_date = components_to_datetime(due_components)
+            if start_date and due_date < start_date:
+                continue
+            if end_date and due_date > end_date:
+                continue
 
-            results.append(Reminder.from_ekreminder(ekreminder))
+            # Reuse the due date computed for filtering rather than converting the components again
+            results.append(Reminder.from_ekreminder(ekreminder, due_date=due_date))
 
         return results
 
@@ -151,7 +210,8 @@ class RemindersManager:
                 raise NoSuchReminderListException(new_reminder.list_name)
         else:
             reminder_list = self.event_store.defaultCalendarForNewReminders()
-            logger.debug(f"Using default reminder list: {reminder_list.title()}")
+            # Lazy so the title() bridge call only happens when the message is actually emitted
+            logger.opt(lazy=True).debug("Using default reminder list: {}", lambda: reminder_list.title())
 
         ekreminder.setCalendar_(reminder_list)
 
@@ -162,7 +222,7 @@ class RemindersManager:
                 logger.error(f"Failed to save reminder: {error}")
                 raise Exception(error)
 
-            logger.info(f"Successfully created reminder: {new_reminder.title}")
+            logger.info("Successfully created reminder: {}", new_reminder.title)
             return Reminder.from_ekreminder(ekreminder)
 
         except Exception as e:
@@ -179,11 +239,7 @@ class RemindersManager:
         Returns:
             Reminder: The updated reminder if successful
         """
-        existing_reminder = self.find_reminder_by_id(reminder_id)
-        if not existing_reminder:
-            raise NoSuchReminderException(reminder_id)
-
-        existing_ek_reminder = existing_reminder._raw_reminder
+        existing_ek_reminder = self.find_ekreminder_by_id(reminder_id)
         if not existing_ek_reminder:
             raise NoSuchReminderException(reminder_id)
 
@@ -219,8 +275,9 @@ class RemindersManager:
                 logger.error(f"Failed to update reminder: {error}")
                 raise Exception(error)
 
-            logger.info(f"Successfully updated reminder: {request.title or existing_reminder.title}")
-            return Reminder.from_ekreminder(existing_ek_reminder)
+            updated_reminder = Reminder.from_ekreminder(existing_ek_reminder)
+            logger.info("Successfully updated reminder: {}", updated_reminder.title)
+            return updated_reminder
 
         except Exception as e:
             logger.error(f"Failed to update reminder: {e}")
@@ -235,11 +292,7 @@ class RemindersManager:
         Returns:
             Reminder: The updated reminder
         """
-        existing_reminder = self.find_reminder_by_id(reminder_id)
-        if not existing_reminder:
-            raise NoSuchReminderException(reminder_id)
-
-        existing_ek_reminder = existing_reminder._raw_reminder
+        existing_ek_reminder = self.find_ekreminder_by_id(reminder_id)
         if not existing_ek_reminder:
             raise NoSuchReminderException(reminder_id)
 
@@ -252,8 +305,9 @@ class RemindersManager:
                 logger.error(f"Failed to complete reminder: {error}")
                 raise Exception(error)
 
-            logger.info(f"Successfully completed reminder: {existing_reminder.title}")
-            return Reminder.from_ekreminder(existing_ek_reminder)
+            completed_reminder = Reminder.from_ekreminder(existing_ek_reminder)
+            logger.info("Successfully completed reminder: {}", completed_reminder.title)
+            return completed_reminder
 
         except Exception as e:
             logger.error(f"Failed to complete reminder: {e}")
@@ -272,14 +326,13 @@ class RemindersManager:
             NoSuchReminderException: If the reminder with the given ID doesn't exist
             Exception: If there was an error deleting the reminder
         """
-        existing_reminder = self.find_reminder_by_id(reminder_id)
-        if not existing_reminder:
-            raise NoSuchReminderException(reminder_id)
-
-        existing_ek_reminder = existing_reminder._raw_reminder
+        existing_ek_reminder = self.find_ekreminder_by_id(reminder_id)
         if not existing_ek_reminder:
             raise NoSuchReminderException(reminder_id)
 
+        # Read the title before removal so the log doesn't touch a deleted reminder
+        title = existing_ek_reminder.title()
+
         try:
             success, error = self.event_store.removeReminder_commit_error_(existing_ek_reminder, True, None)
 
@@ -287,7 +340,7 @@ class RemindersManager:
                 logger.error(f"Failed to delete reminder: {error}")
                 raise Exception(error)
 
-            logger.info(f"Successfully deleted reminder: {existing_reminder.title}")
+            logger.info("Successfully deleted reminder: {}", title)
             return True
 
         except Exception as e:
@@ -303,21 +356,38 @@ class RemindersManager:
         Returns:
             Reminder | None: The reminder if found, None otherwise
         """
-        ekreminder = self.event_store.calendarItemWithIdentifier_(identifier)
+        ekreminder = self.find_ekreminder_by_id(identifier)
         if not ekreminder:
-            logger.info(f"No reminder found with ID: {identifier}")
             return None
 
         return Reminder.from_ekreminder(ekreminder)
 
+    def find_ekreminder_by_id(self, identifier: str) -> EKReminder | None:
+        """Find the raw EKReminder by its identifier without converting it to a Reminder.
+
+        Args:
+            identifier: The unique identifier of the reminder
+
+        Returns:
+            EKReminder | None: The EventKit reminder if found, None otherwise
+        """
+        ekreminder = self.event_store.calendarItemWithIdentifier_(identifier)
+        if not ekreminder:
+            logger.info("No reminder found with ID: {}", identifier)
+            return None
+
+        return ekreminder
+
     def list_reminder_list_names(self) -> list[str]:
         """List all available reminder list names.
 
         Returns:
             list[str]: A list of reminder list names
         """
-        reminder_lists = self.event_store.calendarsForEntityType_(EKEntityTypeReminder)
-        return [reminder_list.title() for reminder_list in reminder_lists]
+        # Always refetch so lists added, renamed or deleted in Reminders show up here
+        self._invalidate_calendar_cache()
+        _, titles, _ = self._get_calendar_cache()
+        return list(titles)
 
     def list_reminder_lists(self) -> list[Any]:
         """List all available reminder lists.
@@ -325,20 +395,22 @@ class RemindersManager:
         Returns:
             list[Any]: A list of EKCalendar objects for reminders
         """
-        return self.event_store.calendarsForEntityType_(EKEntityTypeReminder)
+        self._invalidate_calendar_cache()
+        calendars, _, _ = self._get_calendar_cache()
+        return list(calendars)
 
     def _request_access(self) -> bool:
         """Request access to interact with the macOS Reminders app."""
-        semaphore = Semaphore(0)
+        done = Event()
         access_granted = False
 
         def completion(granted: bool, error) -> None:
             nonlocal access_granted
             access_granted = granted
-            semaphore.release()
+            done.set()
 
         self.event_store.requestAccessToEntityType_completion_(EKEntityTypeReminder, completion)
-        semaphore.acquire()
+        done.wait()
         return access_granted
 
     def _find_list_by_name(self, list_name: str) -> Any | None:
@@ -350,12 +422,62 @@ class RemindersManager:
         Returns:
             Any | None: The reminder list (EKCalendar) if found, None otherwise
         """
-        for reminder_list in self.event_store.calendarsForEntityType_(EKEntityTypeReminder):
-            if reminder_list.title() == list_name:
-                return reminder_list
+        _, _, calendars_by_title = self._get_calendar_cache()
+        reminder_list = self._current_calendar(calendars_by_title.get(list_name), list_name)
+        if reminder_list is None:
+            # The change notification isn't guaranteed to reach this process, so refetch once
+            # in case the list was created, renamed or deleted after the cache was filled
+            self._invalidate_calendar_cache()
+            _, _, calendars_by_title = self._get_calendar_cache()
+            reminder_list = calendars_by_title.get(list_name)
+
+        if reminder_list is None:
+            logger.info("Reminder list '{}' not found", list_name)
+        return reminder_list
+
+    def _current_calendar(self, calendar: Any | None, list_name: str) -> Any | None:
+        """Confirm that a cached reminder list still exists under the given name.
+
+        Args:
+            calendar: The cached reminder list (EKCalendar), if any
+            list_name: The name the list is expected to have
+
+        Returns:
+            Any | None: The store's current EKCalendar if it still has that name, None otherwise
+        """
+        if calendar is None:
+            return None
 
-        logger.info(f"Reminder list '{list_name}' not found")
-        return None
+        current = self.event_store.calendarWithIdentifier_(calendar.calendarIdentifier())
+        if current is None or str(current.title()) != list_name:
+            return None
+        return current
+
+    def _get_calendar_cache(self) -> tuple[list[Any], list[str], dict[str, Any]]:
+        """Return the cached reminder lists, their titles and a title lookup.
+
+        The reminder lists are fetched from the event store on first use and
+        reused until the cache is invalidated. Several lists may share a title;
+        the lookup keeps the first one, as the event store orders them.
+
+        Returns:
+            tuple[list[Any], list[str], dict[str, Any]]: The EKCalendar objects, their titles
+                and the calendars keyed by title
+        """
+        cache = self._calendar_cache
+        if cache is None:
+            calendars = list(self.event_store.calendarsForEntityType_(EKEntityTypeReminder))
+            # Store titles as interned Python strings so lookups hash natively instead of comparing NSString proxies
+            titles = [sys.intern(str(calendar.title())) for calendar in calendars]
+            calendars_by_title: dict[str, Any] = {}
+            for title, calendar in zip(titles, calendars):
+                calendars_by_title.setdefault(title, calendar)
+            cache = self._calendar_cache = (calendars, titles, calendars_by_title)
+        return cache
+
+    def _invalidate_calendar_cache(self) -> None:
+        """Discard the cached reminder lists so the next lookup refetches them."""
+        self._calendar_cache = None
 
     def _datetime_to_components(self, dt: datetime) -> NSDateComponents:
         """Convert a Python datetime to NSDateComponents.
@@ -366,31 +488,33 @@ class RemindersManager:
         Returns:
             NSDateComponents: The corresponding NSDateComponents
         """
-        components = NSDateComponents.alloc().init()
-        components.setYear_(dt.year)
-        components.setMonth_(dt.month)
-        components.setDay_(dt.day)
-        components.setHour_(dt.hour)
-        components.setMinute_(dt.minute)
-        return components
+        return _make_components(dt.year, dt.month, dt.day, dt.hour, dt.minute)
 
-    def _components_to_datetime(self, components: NSDateComponents) -> datetime:
-        """Convert NSDateComponents to Python datetime.
+    def _widened_nsdate(self, dt: datetime, delta: timedelta) -> NSDate | None:
+        """Shift a datetime by delta and convert it to NSDate for a predicate bound.
 
         Args:
-            components: NSDateComponents object
+            dt: Python datetime object
+            delta: The amount to widen the bound by
 
         Returns:
-            datetime: The corresponding Python datetime
+            NSDate | None: The shifted NSDate, or None (unbounded) if the shift leaves the datetime range
         """
-        # Note: NSDateComponents uses NSIntegerMax (0x7FFFFFFFFFFFFFFF) for undefined values
-        return datetime(
-            year=components.year() if components.year() != 0x7FFFFFFFFFFFFFFF else 1,
-            month=components.month() if components.month() != 0x7FFFFFFFFFFFFFFF else 1,
-            day=components.day() if components.day() != 0x7FFFFFFFFFFFFFFF else 1,
-            hour=components.hour() if components.hour() != 0x7FFFFFFFFFFFFFFF else 0,
-            minute=components.minute() if components.minute() != 0x7FFFFFFFFFFFFFFF else 0,
-        )
+        try:
+            return self._datetime_to_nsdate(dt + delta)
+        except OverflowError:
+            return None
+
+    def _datetime_to_nsdate(self, dt: datetime) -> NSDate:
+        """Convert a Python datetime to NSDate.
+
+        Args:
+            dt: Python datetime object
+
+        Returns:
+            NSDate: The corresponding NSDate
+        """
+        return NSDate.dateWithTimeIntervalSince1970_(dt.timestamp())
 
 
 class NoSuchReminderListException(Exception):
@@ -1,6 +1,7 @@
+import asyncio
 import sys
+import threading
 from datetime import datetime
-from functools import lru_cache
 from textwrap import dedent
 
 from loguru import logger
@@ -19,33 +20,52 @@ logger.add(
 )
 
 
+_ACCESS_ERROR_MSG = dedent("""\
+    Reminders access is not granted. Please follow these steps:
+
+    1. Open System Preferences/Settings
+    2. Go to Privacy & Security > Reminders
+    3. Check the box next to your terminal application or Claude Desktop
+    4. Restart Claude Desktop
+
+    Once you've granted access, try your reminder operation again.
+    """)
+
+
 # Initialize the RemindersManager on demand to only request reminders permission
 # when a reminder tool is invoked instead of on the launch of the Claude Desktop app.
-@lru_cache(maxsize=None)
+# Tools call this from worker threads, so creation is guarded to build a single manager.
+_manager: RemindersManager | None = None
+_manager_lock = threading.Lock()
+
+
 def get_reminders_manager() -> RemindersManager:
     """Get or initialize the reminders manager with proper error handling."""
-    try:
-        return RemindersManager()
-    except ValueError as e:
-        error_msg = dedent("""\
-        Reminders access is not granted. Please follow these steps:
+    global _manager
+    if _manager is not None:
+        return _manager
+
+    with _manager_lock:
+        if _manager is not None:
+            return _manager
 
-        1. Open System Preferences/Settings
-        2. Go to Privacy & Security > Reminders
-        3. Check the box next to your terminal application or Claude Desktop
-        4. Restart Claude Desktop
+        try:
+            _manager = RemindersManager()
+            return _manager
+        except ValueError as e:
+            raise ValueError(_ACCESS_ERROR_MSG) from e
 
-        Once you've granted access, try your reminder operation again.
-        """)
-        raise ValueError(error_msg) from e
+
+async def _run(method_name: str, *args):
+    """Call a RemindersManager method in a worker thread, creating the manager there on first use."""
+    return await asyncio.to_thread(lambda: getattr(get_reminders_manager(), method_name)(*args))
 
 
 @mcp.resource("reminders://lists")
-def get_reminder_lists() -> str:
+async def get_reminder_lists() -> str:
     """List all available reminder lists that can be used with reminder operations."""
     try:
-        manager = get_reminders_manager()
-        lists = manager.list_reminder_list_names()
+        lists = await _run("list_reminder_list_names")
         if not lists:
             return "No reminder lists found"
         return "Available reminder lists:\n" + "\n".join(f"- {list_name}" for list_name in lists)
@@ -55,12 +75,13 @@ def get_reminder_lists() -> str:
         return f"Error listing reminder lists: {str(e)}"
 
 
+# Tools run the blocking EventKit calls, including the first-use access prompt, in a worker
+# thread so the event loop stays free to serve other tool calls in the meantime.
 @mcp.tool()
 async def list_reminder_lists() -> str:
     """List all available reminder lists."""
     try:
-        manager = get_reminders_manager()
-        lists = manager.list_reminder_list_names()
+        lists = await _run("list_reminder_list_names")
         if not lists:
             return "No reminder lists found"
 
@@ -86,8 +107,7 @@ async def list_reminders(
         include_completed: Whether to include completed reminders (default: False)
     """
     try:
-        manager = get_reminders_manager()
-        reminders = manager.list_reminders(start_date, end_date, list_name, include_completed)
+        reminders = await _run("list_reminders", start_date, end_date, list_name, include_completed)
         if not reminders:
             return "No reminders found matching the criteria"
 
@@ -116,11 +136,9 @@ async def create_reminder(create_reminder_request: CreateReminderRequest) -> str
             e.g. [60, 1440] means two alarms: 1 hour before and 24 hours before
         url: Optional URL associated with the reminder
     """
-    logger.info(f"Incoming Create Reminder Request: {create_reminder_request}")
+    logger.info("Incoming Create Reminder Request: {}", create_reminder_request)
     try:
-        manager = get_reminders_manager()
-
-        reminder = manager.create_reminder(create_reminder_request)
+        reminder = await _run("create_reminder", create_reminder_request)
         if not reminder:
             return "Failed to create reminder. Please check reminders permissions and try again."
 
@@ -151,8 +169,7 @@ async def update_reminder(reminder_id: str, update_reminder_request: UpdateRemin
         completed: Optional completion status (True/False)
     """
     try:
-        manager = get_reminders_manager()
-        reminder = manager.update_reminder(reminder_id, update_reminder_request)
+        reminder = await _run("update_reminder", reminder_id, update_reminder_request)
         if not reminder:
             return f"Failed to update reminder. Reminder with ID {reminder_id} not found or update failed."
 
@@ -170,8 +187,7 @@ async def complete_reminder(reminder_id: str) -> str:
         reminder_id: Unique identifier of the reminder to complete
     """
     try:
-        manager = get_reminders_manager()
-        reminder = manager.complete_reminder(reminder_id)
+        reminder = await _run("complete_reminder", reminder_id)
         if not reminder:
             return f"Failed to complete reminder. Reminder with ID {reminder_id} not found."
 
@@ -189,8 +205,7 @@ async def delete_reminder(reminder_id: str) -> str:
         reminder_id: Unique identifier of the reminder to delete
     """
     try:
-        manager = get_reminders_manager()
-        success = manager.delete_reminder(reminder_id)
+        success = await _run("delete_reminder", reminder_id)
         if not success:
             return f"Failed to delete reminder. Reminder with ID {reminder_id} not found."
 